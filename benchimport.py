@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""Measures the cold-start overhead of importing `ricecake`.
+
+Each statement is run in fresh interpreter processes, reporting the median
+import time from `python -X importtime` and the increase of peak RSS.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+STATEMENTS = [
+    "import ricecake",
+    "from ricecake import is_syllable",
+    "from ricecake import Searcher",
+    "from ricecake import Corpus, SearchCache",
+    "from ricecake import collation_key; collation_key('가')",
+]
+
+# runs in a subprocess: resident pages before and after running the statement
+MEASURE_RSS = """
+import sys
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1])
+before = rss()
+exec(sys.argv[1])
+print(before, rss())
+"""
+
+
+def import_time(statement: str) -> int:
+    """Returns the cumulative import time of `ricecake` and its submodules in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        # nested imports are indented, and lazy imports are at the top level
+        _, cumulative, package = line.split("|")
+        if package.startswith(" ricecake"):
+            total += int(cumulative)
+    return total
+
+
+def rss_increase(statement: str) -> int:
+    """Returns the increase of RSS in KiB. Only supported on Linux."""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_RSS, statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    before, after = map(int, result.stdout.split())
+    return (after - before) * PAGE_SIZE // 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("statements", nargs="*", default=STATEMENTS)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, median of {args.repeat} runs")
+    print(f"{'statement':56} {'import':>10} {'RSS':>10}")
+    for statement in args.statements:
+        times = [import_time(statement) for _ in range(args.repeat)]
+        rss = [rss_increase(statement) for _ in range(args.repeat)]
+        time_ms = statistics.median(times) / 1000
+        print(f"{statement:56} {time_ms:7.2f} ms {statistics.median(rss):7} KiB")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+"""Compares single-threaded and thread pool scanning of `Searcher.search()`.
+
+Python's `re` module holds the GIL while matching, so the thread pool mode
+is expected to be slower on regular builds of CPython, and faster only on
+free-threaded builds (e.g. `python3.13t`). Run this on the interpreter
+you deploy with to pick the right mode.
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from ricecake import Corpus, Searcher
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 12)))
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--query", default="ㄱㅅ")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = Corpus({"name": 2.0, "alias": 1.0, "address": 1.0})
+    corpus.extend(
+        {field: random_text(rng) for field in corpus.weights}
+        for _ in range(args.records)
+    )
+    searcher = Searcher(
+        choseong_search=True,
+        jongseong_completion=True,
+        incremental=True,
+        fuzzy=False,
+    )
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]} (GIL {'enabled' if gil else 'disabled'})")
+    print(f"{args.records} records, query {args.query!r}")
+
+    expected = searcher.search(args.query, corpus)
+    single = best_of(args.repeat, lambda: searcher.search(args.query, corpus))
+    print(f"single-threaded: {single * 1000:8.1f} ms")
+
+    for workers in args.workers:
+        with ThreadPoolExecutor(workers) as executor:
+            search = partial(
+                searcher.search,
+                args.query,
+                corpus,
+                executor=executor,
+                chunk_size=args.chunk_size,
+            )
+            assert search() == expected
+            elapsed = best_of(args.repeat, search)
+        speedup = single / elapsed
+        print(f"{workers:2} threads:      {elapsed * 1000:8.1f} ms ({speedup:.2f}x)")
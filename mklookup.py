@@ -7,7 +7,7 @@
 """
 
 import unicodedata as ud
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TypeVar
 
 
@@ -64,6 +64,11 @@ if __name__ == "__main__":
     def mklookup(convert: Callable[[str], T], base: int, end: int) -> list[T]:
         return [convert(chr(code)) for code in range(base, end + 1)]
 
+    def pack(table: Sequence[str | None]) -> str:
+        chars = [c for c in table if c is not None]
+        assert len(chars) == len(table), "cannot pack a table with `None`"
+        return repr("".join(chars))
+
     CHOSEONG_TO_COMPAT_JAUM = mklookup(
         jamo_to_compat_jamo,
         o.MODERN_CHOSEONG_BASE,
@@ -92,8 +97,8 @@ if __name__ == "__main__":
         o.MODERN_JONGSEONG_END,
     )
 
-    print(f"CHOSEONG_TO_COMPAT_JAUM = {CHOSEONG_TO_COMPAT_JAUM}\n")
-    print(f"JONGSEONG_TO_COMPAT_JAUM = {JONGSEONG_TO_COMPAT_JAUM}\n")
-    print(f"COMPAT_JAUM_TO_CHOSEONG = {COMPAT_JAUM_TO_CHOSEONG}\n")
-    print(f"COMPAT_JAUM_TO_JONGSEONG = {COMPAT_JAUM_TO_JONGSEONG}\n")
-    print(f"DECOMPOSE_JONGSEONG = {DECOMPOSE_JONGSEONG}\n")
+    print(f"CHOSEONG_TO_COMPAT_JAUM = {pack(CHOSEONG_TO_COMPAT_JAUM)}\n")
+    print(f"JONGSEONG_TO_COMPAT_JAUM = {pack(JONGSEONG_TO_COMPAT_JAUM)}\n")
+    print(f"COMPAT_JAUM_TO_CHOSEONG = {tuple(COMPAT_JAUM_TO_CHOSEONG)}\n")
+    print(f"COMPAT_JAUM_TO_JONGSEONG = {pack(COMPAT_JAUM_TO_JONGSEONG)}\n")
+    print(f"DECOMPOSE_JONGSEONG = {tuple(DECOMPOSE_JONGSEONG)}\n")
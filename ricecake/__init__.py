@@ -6,7 +6,75 @@
 :license: MIT, see LICENSE for more details.
 """
 
+from importlib import import_module as _import_module
+
+# NOTE: `compose` is imported eagerly since its name is shared with a function
+# | importing the submodule later would replace `ricecake.compose()` with it
+from . import compose as _compose
+from . import offset as _offset
 from .compose import *
-from .convert import *
 from .offset import *
-from .search import *
+
+__all__: list[str] = []
+__all__ += _compose.__all__
+__all__ += _offset.__all__
+
+TYPE_CHECKING = False  # avoids importing `typing` at runtime
+if TYPE_CHECKING:
+    from . import cache as _cache
+    from . import collate as _collate
+    from . import convert as _convert
+    from . import corpus as _corpus
+    from . import ime as _ime
+    from . import search as _search
+    from .cache import *
+    from .collate import *
+    from .convert import *
+    from .corpus import *
+    from .ime import *
+    from .search import *
+
+    __all__ += _cache.__all__
+    __all__ += _collate.__all__
+    __all__ += _convert.__all__
+    __all__ += _corpus.__all__
+    __all__ += _ime.__all__
+    __all__ += _search.__all__
+
+
+# NOTE: rest of the submodules are imported on the first access of their names
+# | keeps `import ricecake` cheap for short-lived processes
+# | copies of the `__all__` of each submodule, checked by `tests/test_init.py`
+_LAZY_SUBMODULES = {
+    "cache": ["SearchCache", "broader_queries"],
+    "collate": ["collation_key", "collation_keys"],
+    "convert": ["to_compat_jamo", "to_choseong", "to_jungseong", "to_jongseong"],
+    "corpus": ["Column", "Corpus"],
+    "ime": ["Edit", "Composer", "keystrokes"],
+    "search": ["Hit", "Searcher", "rank", "rank_by_length", "sort_by_collation"],
+}
+
+_LAZY_NAMES = {name: sub for sub, names in _LAZY_SUBMODULES.items() for name in names}
+
+if not TYPE_CHECKING:
+    __all__.extend(_LAZY_NAMES)
+
+del TYPE_CHECKING  # not a part of the public API
+
+
+def __getattr__(name: str) -> object:
+    # the import system also binds the submodule to the package on its first import
+    if name in _LAZY_SUBMODULES:
+        return _import_module(f".{name}", __name__)
+
+    submodule = _LAZY_NAMES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
@@ -0,0 +1,150 @@
+"""Caching search results, and reusing them for longer queries."""
+
+import sys
+from collections import OrderedDict
+
+from .corpus import Corpus
+from .ime import Composer, Edit, keystrokes
+from .search import Hit, Searcher
+
+__all__ = [
+    "SearchCache",
+    "broader_queries",
+]
+
+
+# rough size of a cached hit: the tuple itself, its `int` fields, and a `float` score
+HIT_SIZE = (
+    sys.getsizeof(
+        Hit(record=0, score=0.0, field="", start=0, end=0, exact=False, length=0)
+    )
+    + sys.getsizeof(2**30) * 4
+    + sys.getsizeof(0.0)
+)
+
+
+def broader_queries(query: str, /, *, incremental: bool) -> list[str]:
+    """Lists queries whose results always include the results of the query.
+
+    Ordered from the narrowest to the broadest.
+    e.g. `"서울"` -> `["서우", "서ㅇ", "서"]`
+
+    - Removing the last character only makes the search broader.
+    - With incremental search, so does any earlier state of the last Syllable
+      while typing it with `Composer`, such as `"서ㅇ"` and `"서우"`.
+    """
+    if not query:
+        return []
+
+    prefix, last = query[:-1], query[-1]
+    queries: list[str] = []
+
+    if incremental:
+        composer = Composer()
+        states: list[str] = []
+        for key in keystrokes(last):
+            if composer.push(key) is Edit.REVISE:
+                states.clear()
+            states.append(composer.text)
+        queries.extend(prefix + state for state in reversed(states[:-1]))
+
+    if prefix:
+        queries.append(prefix)
+    return queries
+
+
+def entry_size(key: tuple[Searcher, str], hits: tuple[Hit, ...]) -> int:
+    return sys.getsizeof(key[1]) + sys.getsizeof(hits) + len(hits) * HIT_SIZE
+
+
+class SearchCache:
+    """LRU cache of `Searcher.search()` results on a corpus.
+
+    Results are cached per query and searcher options. The whole cache is
+    dropped whenever the version of the corpus changes. The cache is bounded
+    by both the number of entries and their estimated size in bytes.
+
+    On a miss, if the results of one of the `broader_queries()` are cached,
+    only those records are searched instead of the whole corpus.
+    e.g. `"서울"` only searches the cached results of `"서우"` or `"서"`.
+    """
+
+    __slots__ = ("_entries", "_size", "_version", "corpus", "max_entries", "max_size")
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        *,
+        max_entries: int = 1024,
+        max_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Creates an empty cache of the corpus, bounded by entries and bytes."""
+        self.corpus = corpus
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[Searcher, str], tuple[Hit, ...]] = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._version = corpus.version
+
+    def __len__(self) -> int:
+        """Number of cached queries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Estimated memory usage of the cached results in bytes."""
+        return self._size
+
+    def clear(self) -> None:
+        """Drops every cached result."""
+        self._entries.clear()
+        self._size = 0
+
+    def search(
+        self,
+        searcher: Searcher,
+        query: str,
+        /,
+        *,
+        limit: int | None = None,
+    ) -> list[Hit]:
+        """Searches the corpus with the searcher, reusing cached results.
+
+        Returns the same hits as `searcher.search(query, corpus, limit=limit)`.
+        All hits are searched and cached regardless of the `limit`,
+        so that they can be reused by longer queries.
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        if self._version != self.corpus.version:
+            self.clear()
+            self._version = self.corpus.version
+
+        key = (searcher, query)
+        if (cached := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return list(cached[:limit])
+
+        within = None
+        for broader in broader_queries(query, incremental=searcher.incremental):
+            if (cached := self._entries.get((searcher, broader))) is not None:
+                within = [hit.record for hit in cached]
+                break
+
+        hits = searcher.search(query, self.corpus, within=within)
+        self._insert(key, tuple(hits))
+        return hits[:limit]
+
+    def _insert(self, key: tuple[Searcher, str], hits: tuple[Hit, ...]) -> None:
+        size = entry_size(key, hits)
+        if size > self.max_size:
+            return
+
+        self._entries[key] = hits
+        self._size += size
+        while len(self._entries) > self.max_entries or self._size > self.max_size:
+            old_key, old_hits = self._entries.popitem(last=False)
+            self._size -= entry_size(old_key, old_hits)
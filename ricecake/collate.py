@@ -0,0 +1,97 @@
+"""Collation keys for sorting Korean texts in dictionary order.
+
+Unicode codepoint order places Compatibility Jamos (`"ㄱ"`) before every
+Hangul Syllable, and has no idea that `"ㄱ"` should be grouped with `"가"`.
+The keys generated here fix that while staying plain `str` objects,
+so a list of keys can be sorted with a single C-level `list.sort()`.
+
+- Hangul Syllables are ordered by Choseong, Jungseong, then Jongseong.
+- A Compatibility Jaum comes right before the Syllables starting with it.
+  e.g. `"ㄱ" < "ㄳ" < "가" < "깋" < "ㄲ" < "까"`
+- Compatibility Moums come after all Syllables.
+- Everything else keeps its codepoint order.
+"""
+
+from collections.abc import Iterable
+from functools import cache
+
+from . import offset as o
+from .compose import decompose, decompose_jongseong
+from .convert import to_choseong, to_compat_jamo, to_jongseong
+
+__all__ = [
+    "collation_key",
+    "collation_keys",
+]
+
+
+# NOTE: every Hangul character is packed into 2 characters, `LEAD + chr(rank)`
+# | `LEAD` is the first Syllable '가', which itself is always remapped.
+# | So a non-Hangul character can never tie with `LEAD` and compare its rank.
+COLLATION_LEAD = chr(o.SYLLABLE_BASE)
+
+# slot 0 is the Jaum itself, and the rest are composite Jaums starting with it
+COLLATION_JAUM_SLOTS = 8
+COLLATION_BLOCK = COLLATION_JAUM_SLOTS + o.CHOSEONG_COEF
+COLLATION_MOUM_BASE = o.CHOSEONG_COUNT * COLLATION_BLOCK
+
+
+@cache
+def collation_table() -> dict[int, str]:
+    """Builds the `str.translate()` table used by `collation_key()`.
+
+    The table is built on the first call instead of import time,
+    since it holds an entry for each of the 11,172 Hangul Syllables.
+    """
+    table: dict[int, str] = {}
+
+    for code in range(o.SYLLABLE_BASE, o.SYLLABLE_END + 1):
+        cho = decompose(chr(code))[0]
+        rank = o.choseong_offset(cho) * COLLATION_BLOCK + COLLATION_JAUM_SLOTS
+        rank += (code - o.SYLLABLE_BASE) % o.CHOSEONG_COEF
+        table[code] = COLLATION_LEAD + chr(rank)
+
+    # composite Jaums are placed in the slots of their first component
+    # e.g. "ㄱ" -> slot 0 of "ᄀ" / "ㄳ" -> slot 1 of "ᄀ"
+    slots = [1] * o.CHOSEONG_COUNT
+    for code in range(o.MODERN_COMPAT_JAUM_BASE, o.MODERN_COMPAT_JAUM_END + 1):
+        jaum = chr(code)
+        cho = to_choseong(jaum)  # composite Jaums map to archaic Choseongs
+        if cho and o.MODERN_CHOSEONG_BASE <= ord(cho) <= o.MODERN_CHOSEONG_END:
+            slot = 0
+        else:
+            first = to_compat_jamo(decompose_jongseong(to_jongseong(jaum))[0])
+            cho = to_choseong(first)
+            assert cho is not None
+            slot = slots[o.choseong_offset(cho)]
+            slots[o.choseong_offset(cho)] += 1
+        rank = o.choseong_offset(cho) * COLLATION_BLOCK + slot
+        table[code] = COLLATION_LEAD + chr(rank)
+
+    for code in range(o.MODERN_COMPAT_MOUM_BASE, o.MODERN_COMPAT_MOUM_END + 1):
+        rank = COLLATION_MOUM_BASE + o.compat_moum_offset(chr(code))
+        table[code] = COLLATION_LEAD + chr(rank)
+
+    return table
+
+
+def collation_key(text: str, /) -> str:
+    """Generates a collation key that sorts Korean texts in dictionary order.
+
+    Keys are only meant to be compared with each other, not to be displayed.
+    Comparing the keys of two texts is equivalent to comparing the texts
+    character by character with Korean dictionary order.
+    """
+    return text.translate(collation_table())
+
+
+def collation_keys(texts: Iterable[str], /) -> list[str]:
+    """Generates collation keys of multiple texts at once.
+
+    The keys are meant to be computed once and stored next to the texts,
+    so that sorting them only costs a single `list.sort()`.
+    e.g. `order = sorted(range(len(keys)), key=keys.__getitem__)`
+    `Corpus` does this for its records with a `collation_field`.
+    """
+    table = collation_table()
+    return [text.translate(table) for text in texts]
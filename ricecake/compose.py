@@ -12,10 +12,11 @@ __all__ = [
     "set_jungseong",
     "set_jongseong",
     "decompose_jongseong",
+    "compose_jongseong",
 ]
 
 
-DECOMPOSE_JONGSEONG = [
+DECOMPOSE_JONGSEONG = (
     ("ᆨ", None),
     ("ᆨ", "ᆨ"),
     ("ᆨ", "ᆺ"),
@@ -43,7 +44,13 @@ DECOMPOSE_JONGSEONG = [
     ("ᇀ", None),
     ("ᇁ", None),
     ("ᇂ", None),
-]
+)
+
+COMPOSE_JONGSEONG = {
+    pair: chr(i + o.MODERN_JONGSEONG_BASE)
+    for i, pair in enumerate(DECOMPOSE_JONGSEONG)
+    if pair[1] is not None
+}
 
 
 # FEAT: LATER: compose syllable compat jamo
@@ -164,6 +171,20 @@ def decompose_jongseong(jongseong: str) -> tuple[str, str | None]:
     return DECOMPOSE_JONGSEONG[o.jongseong_offset(jongseong)]
 
 
+def compose_jongseong(first: str, second: str) -> str | None:
+    """Composes 2 Jongseong characters into a composite Jongseong.
+
+    This is the inverse of `decompose_jongseong()`.
+    Returns `None` if the Jongseongs cannot be composed.
+
+    Raises:
+        ValueError: If the characters are not Hangul Jamo Jongseongs.
+    """
+    o.jongseong_offset(first)
+    o.jongseong_offset(second)
+    return COMPOSE_JONGSEONG.get((first, second))
+
+
 # FEAT: decompose composite Jaum and Moum into tuple of str
 # |
 # | - [ ] There are 5 cases, cho/jung/jong and compat jaum/moum.
@@ -12,59 +12,13 @@ __all__ = [
 ]
 
 
-CHOSEONG_TO_COMPAT_JAUM = [
-    "ㄱ",
-    "ㄲ",
-    "ㄴ",
-    "ㄷ",
-    "ㄸ",
-    "ㄹ",
-    "ㅁ",
-    "ㅂ",
-    "ㅃ",
-    "ㅅ",
-    "ㅆ",
-    "ㅇ",
-    "ㅈ",
-    "ㅉ",
-    "ㅊ",
-    "ㅋ",
-    "ㅌ",
-    "ㅍ",
-    "ㅎ",
-]
+# NOTE: tables without `None` are packed into a single `str` indexed by offset
+# | much smaller than a `list` of 1-character `str` objects, and immutable
+CHOSEONG_TO_COMPAT_JAUM = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
 
-JONGSEONG_TO_COMPAT_JAUM = [
-    "ㄱ",
-    "ㄲ",
-    "ㄳ",
-    "ㄴ",
-    "ㄵ",
-    "ㄶ",
-    "ㄷ",
-    "ㄹ",
-    "ㄺ",
-    "ㄻ",
-    "ㄼ",
-    "ㄽ",
-    "ㄾ",
-    "ㄿ",
-    "ㅀ",
-    "ㅁ",
-    "ㅂ",
-    "ㅄ",
-    "ㅅ",
-    "ㅆ",
-    "ㅇ",
-    "ㅈ",
-    "ㅊ",
-    "ㅋ",
-    "ㅌ",
-    "ㅍ",
-    "ㅎ",
-]
+JONGSEONG_TO_COMPAT_JAUM = "ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
 
-COMPAT_JAUM_TO_CHOSEONG = [
+COMPAT_JAUM_TO_CHOSEONG = (
     "ᄀ",
     "ᄁ",
     None,
@@ -95,40 +49,9 @@ COMPAT_JAUM_TO_CHOSEONG = [
     "ᄐ",
     "ᄑ",
     "ᄒ",
-]
+)
 
-COMPAT_JAUM_TO_JONGSEONG = [
-    "ᆨ",
-    "ᆩ",
-    "ᆪ",
-    "ᆫ",
-    "ᆬ",
-    "ᆭ",
-    "ᆮ",
-    "ퟍ",
-    "ᆯ",
-    "ᆰ",
-    "ᆱ",
-    "ᆲ",
-    "ᆳ",
-    "ᆴ",
-    "ᆵ",
-    "ᆶ",
-    "ᆷ",
-    "ᆸ",
-    "ퟦ",
-    "ᆹ",
-    "ᆺ",
-    "ᆻ",
-    "ᆼ",
-    "ᆽ",
-    "ퟹ",
-    "ᆾ",
-    "ᆿ",
-    "ᇀ",
-    "ᇁ",
-    "ᇂ",
-]
+COMPAT_JAUM_TO_JONGSEONG = "ᆨᆩᆪᆫᆬᆭᆮퟍᆯᆰᆱᆲᆳᆴᆵᆶᆷᆸퟦᆹᆺᆻᆼᆽퟹᆾᆿᇀᇁᇂ"
 
 
 # FIX: LATER: refactor repetitive try-except blocks
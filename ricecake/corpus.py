@@ -0,0 +1,205 @@
+"""Column-oriented storage of texts to be searched."""
+
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+
+from .collate import collation_key
+
+__all__ = [
+    "Column",
+    "Corpus",
+]
+
+
+# NOTE: generated patterns never match a newline, so it can separate texts
+# | character classes never contain it, and fuzzy search uses `.` (no DOTALL)
+SEPARATOR = "\n"
+
+
+class Column:
+    """Texts of a single field, stored contiguously in a single `str`.
+
+    Texts are joined with newlines, and newlines inside texts are replaced
+    with spaces. The start offset of each text is kept in an `array`, so
+    memory usage is the size of the joined `str` plus 8 bytes per text.
+    """
+
+    __slots__ = ("_pending", "_text", "offsets")
+
+    def __init__(self) -> None:
+        """Creates an empty column."""
+        self._pending: list[str] = []
+        self._text = ""
+        self.offsets = array("Q", [0])  # text `i` is `offsets[i]:offsets[i+1]-1`
+
+    def __len__(self) -> int:
+        """Number of texts in the column."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int, /) -> str:
+        """Returns a text, with its newlines replaced with spaces."""
+        start, end = self.span(index)
+        return self.text[start:end]
+
+    @property
+    def text(self) -> str:
+        """All texts joined with newlines, each ending with a newline."""
+        if self._pending:
+            self._text = "".join([self._text, *self._pending])
+            self._pending.clear()
+        return self._text
+
+    def span(self, index: int, /) -> tuple[int, int]:
+        """Returns the start and end offset of a text in the joined `text`."""
+        if index < 0:
+            index += len(self)
+        return self.offsets[index], self.offsets[index + 1] - 1
+
+    def append(self, text: str, /) -> None:
+        """Appends a text to the column."""
+        self._pending.append(text.replace(SEPARATOR, " ") + SEPARATOR)
+        self.offsets.append(self.offsets[-1] + len(text) + 1)
+
+    def search(self, pattern: re.Pattern[str], index: int, /) -> re.Match[str] | None:
+        """Finds the first match of a single text."""
+        return pattern.search(self.text, *self.span(index))
+
+    def scan(
+        self,
+        pattern: re.Pattern[str],
+        start: int = 0,
+        stop: int | None = None,
+    ) -> Iterator[tuple[int, re.Match[str]]]:
+        """Finds the first match of each text, within the texts `[start:stop]`.
+
+        The whole column is scanned with a single `pattern.search()` per match,
+        instead of calling it on each text.
+        """
+        text = self.text
+        offsets = self.offsets
+        pos = offsets[start]
+        endpos = offsets[len(self) if stop is None else stop]
+
+        # an empty pattern would also match at `endpos`, past the last text
+        while pos < endpos and (m := pattern.search(text, pos, endpos)):
+            index = bisect_right(offsets, m.start()) - 1
+            end = offsets[index + 1] - 1
+
+            # the query itself contained a newline and matched across texts
+            if m.end() > end:
+                m = pattern.search(text, m.start(), end)
+
+            if m:
+                yield index, m
+            pos = end + 1
+
+
+class Corpus:
+    """Records with multiple weighted fields, stored column by column.
+
+    Each field is stored as a `Column`, instead of a Python object per record.
+    `version` is increased whenever the corpus is modified.
+    `sorted_by_length` tells whether records were appended in the order of
+    their `length()`, which lets searches with a `limit` stop early.
+
+    With a `collation_field`, the `collation_key()` of that field is stored
+    in `collation_keys` for each record as it is appended,
+    so that hits can be sorted in dictionary order with `sort_by_collation()`.
+
+    ```
+    corpus = Corpus({"name": 2.0, "address": 1.0}, collation_field="name")
+    corpus.append({"name": "홍길동", "address": "서울특별시"})
+    ```
+    """
+
+    __slots__ = (
+        "_collation_ranks",
+        "_collation_version",
+        "_last_length",
+        "collation_field",
+        "collation_keys",
+        "columns",
+        "sorted_by_length",
+        "version",
+        "weights",
+    )
+
+    def __init__(
+        self,
+        weights: Mapping[str, float],
+        *,
+        collation_field: str | None = None,
+    ) -> None:
+        """Creates an empty corpus with fields and their weights.
+
+        Raises:
+            ValueError: If there are no fields, or `collation_field` is not one.
+        """
+        if not weights:
+            raise ValueError("expected at least one field")
+        if collation_field is not None and collation_field not in weights:
+            raise ValueError(f"unknown collation field {collation_field!r}")
+        self.weights = dict(weights)
+        self.columns = {field: Column() for field in self.weights}
+        self.collation_field = collation_field
+        self.collation_keys: list[str] = []  # empty without a `collation_field`
+        self.version = 0
+        self._collation_ranks = array("Q")
+        self._collation_version = self.version
+        self.sorted_by_length = True
+        self._last_length = 0
+
+    def __len__(self) -> int:
+        """Number of records in the corpus."""
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, index: int, /) -> dict[str, str]:
+        """Returns a record as a `dict` of its fields."""
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def length(self, index: int, /) -> int:
+        """Total length of the texts of a record."""
+        spans = (column.span(index) for column in self.columns.values())
+        return sum(end - start for start, end in spans)
+
+    def collation_ranks(self) -> "array[int]":
+        """Position of each record in the dictionary order of `collation_keys`.
+
+        The keys are sorted on the first call after the corpus is modified,
+        and the ranks are reused until it is modified again.
+        """
+        if self._collation_version != self.version:
+            keys = self.collation_keys
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            ranks = array("Q", bytes(8 * len(order)))
+            for rank, index in enumerate(order):
+                ranks[index] = rank
+            self._collation_ranks = ranks
+            self._collation_version = self.version
+        return self._collation_ranks
+
+    def append(self, record: Mapping[str, str], /) -> None:
+        """Appends a record. Missing fields are treated as empty texts."""
+        self._append(record)
+        self.version += 1
+
+    def extend(self, records: Iterable[Mapping[str, str]], /) -> None:
+        """Appends multiple records."""
+        for record in records:
+            self._append(record)
+        self.version += 1
+
+    def _append(self, record: Mapping[str, str], /) -> None:
+        length = 0
+        for field, column in self.columns.items():
+            text = record.get(field, "")
+            column.append(text)
+            length += len(text)
+            if field == self.collation_field:
+                self.collation_keys.append(collation_key(text))
+
+        if length < self._last_length:
+            self.sorted_by_length = False
+        self._last_length = length
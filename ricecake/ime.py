@@ -0,0 +1,229 @@
+"""Composing Hangul Syllables from a stream of keystrokes, like an IME does."""
+
+from enum import Enum
+
+from . import offset as o
+from .compose import compose, compose_jongseong, decompose, decompose_jongseong
+from .convert import to_choseong, to_compat_jamo, to_jongseong, to_jungseong
+
+__all__ = [
+    "Edit",
+    "Composer",
+    "keystrokes",
+]
+
+
+# NOTE: composability is based on Korean keyboard and IME behavior
+# | `ㅐ`: can be typed directly from a keyboard.
+# | `ㅘ`: can only be typed as `ㅗ + ㅏ`.
+COMPOSE_JUNGSEONG = {
+    ("ᅩ", "ᅡ"): "ᅪ",
+    ("ᅩ", "ᅢ"): "ᅫ",
+    ("ᅩ", "ᅵ"): "ᅬ",
+    ("ᅮ", "ᅥ"): "ᅯ",
+    ("ᅮ", "ᅦ"): "ᅰ",
+    ("ᅮ", "ᅵ"): "ᅱ",
+    ("ᅳ", "ᅵ"): "ᅴ",
+}
+
+DECOMPOSE_JUNGSEONG = {
+    composite: first for (first, _), composite in COMPOSE_JUNGSEONG.items()
+}
+
+JUNGSEONG_KEYSTROKES = {
+    composite: pair for pair, composite in COMPOSE_JUNGSEONG.items()
+}
+
+
+def is_modern_choseong(c: str, /) -> bool:
+    return o.MODERN_CHOSEONG_BASE <= ord(c) <= o.MODERN_CHOSEONG_END
+
+
+def is_modern_jongseong(c: str, /) -> bool:
+    return o.MODERN_JONGSEONG_BASE <= ord(c) <= o.MODERN_JONGSEONG_END
+
+
+def keystrokes(c: str, /) -> list[str]:
+    """Lists the Compatibility Jamo keystrokes typing a character with `Composer`.
+
+    Characters other than Hangul Syllables are typed as themselves.
+    e.g. `"닭"` -> `["ㄷ", "ㅏ", "ㄹ", "ㄱ"]` / `"ㄱ"` -> `["ㄱ"]`
+    """
+    if not o.is_syllable(c):
+        return [c]
+
+    cho, jung, jong = decompose(c)
+    keys = [to_compat_jamo(cho)]
+    keys.extend(map(to_compat_jamo, JUNGSEONG_KEYSTROKES.get(jung, (jung,))))
+    if jong:
+        first, second = decompose_jongseong(jong)
+        if second and first != second:  # ssangjaums have their own keys
+            keys.extend((to_compat_jamo(first), to_compat_jamo(second)))
+        else:
+            keys.append(to_compat_jamo(jong))
+    return keys
+
+
+class Edit(Enum):
+    """How the query has changed after a keystroke.
+
+    Attributes:
+        EXTEND: The new query can only narrow down the results of the old one.
+            i.e. Every text matching the new query also matches the old query,
+            so the old results can be filtered instead of searching the whole
+            corpus again. Only guaranteed for `Searcher`s with `incremental` set,
+            since otherwise the last character is matched exactly.
+        REVISE: The new query may match texts the old one did not.
+    """
+
+    EXTEND = "extend"
+    REVISE = "revise"
+
+
+class Composer:
+    """Composes Hangul Syllables from Compatibility Jamo keystrokes.
+
+    Follows the behavior of the standard 2-set (두벌식) Korean keyboard.
+    Only the Syllable being typed is kept as a state, so each keystroke
+    takes constant time regardless of the length of the text.
+    Finished characters are appended to `prefix` as they are committed,
+    so the query is never recomposed from scratch.
+
+    ```
+    composer = Composer()
+    for key in "ㄷㅏㄹㄱㅇㅣ":
+        edit = composer.push(key)
+    assert composer.text == "닭이"
+    ```
+    """
+
+    __slots__ = ("_cho", "_jong", "_jung", "_prefix")
+
+    def __init__(self) -> None:
+        """Creates a composer with nothing typed."""
+        self._prefix = ""
+        self._cho: str | None = None
+        self._jung: str | None = None
+        self._jong: str | None = None
+
+    @property
+    def prefix(self) -> str:
+        """The characters composed so far, excluding the Syllable being typed."""
+        return self._prefix
+
+    @property
+    def text(self) -> str:
+        """The whole text composed so far, including the Syllable being typed.
+
+        Same as `prefix + preedit`.
+        """
+        return self._prefix + self.preedit
+
+    @property
+    def preedit(self) -> str:
+        """The Syllable (or a standalone Jamo) being typed."""
+        if self._cho and self._jung:
+            return compose(self._cho, self._jung, self._jong)
+        if self._cho:
+            return to_compat_jamo(self._cho)
+        if self._jung:
+            return to_compat_jamo(self._jung)
+        return ""
+
+    def push(self, key: str, /) -> Edit:
+        """Feeds a keystroke and returns how the query has changed.
+
+        Characters other than modern Compatibility Jamos are appended as is.
+        """
+        if o.is_compat_jaum(key):
+            return self._push_jaum(key)
+        if o.is_compat_moum(key):
+            return self._push_moum(key)
+
+        self.commit()
+        self._prefix += key
+        return Edit.EXTEND
+
+    def pop(self) -> Edit:
+        """Erases the last typed Jamo, or the last character if nothing is being typed.
+
+        Raises:
+            IndexError: If there is nothing to erase.
+        """
+        if self._jong:
+            first, second = decompose_jongseong(self._jong)
+            self._jong = first if second and first != second else None
+        elif self._jung:
+            self._jung = DECOMPOSE_JUNGSEONG.get(self._jung)
+        elif self._cho:
+            self._cho = None
+        elif self._prefix:
+            self._prefix = self._prefix[:-1]
+        else:
+            raise IndexError("nothing to erase")
+        return Edit.REVISE
+
+    def commit(self) -> None:
+        """Finishes the Syllable being typed, so the next keystroke starts a new one."""
+        self._prefix += self.preedit
+        self._cho = self._jung = self._jong = None
+
+    def clear(self) -> None:
+        """Erases everything."""
+        self._prefix = ""
+        self._cho = self._jung = self._jong = None
+
+    def _push_jaum(self, jaum: str) -> Edit:
+        # "가" + "ㄹ" -> "갈" / "갈" + "ㄱ" -> "갉"
+        jong = to_jongseong(jaum)  # "ㄸ", "ㅃ", "ㅉ" are not modern Jongseongs
+        if self._cho and self._jung and is_modern_jongseong(jong):
+            if self._jong is None:
+                self._jong = jong
+                return Edit.EXTEND
+
+            # "ㄱ" + "ㄱ" is not "ㄲ", which has its own key
+            composite = compose_jongseong(self._jong, jong)
+            if composite and self._jong != jong:
+                self._jong = composite
+                return Edit.EXTEND
+
+        self.commit()
+        cho = to_choseong(jaum)
+        if cho and is_modern_choseong(cho):
+            self._cho = cho
+        else:
+            self._prefix += jaum  # composite Jaums such as "ㄳ"
+        return Edit.EXTEND
+
+    def _push_moum(self, moum: str) -> Edit:
+        jung = to_jungseong(moum)
+
+        # "ㄱ" + "ㅏ" -> "가"
+        if self._cho and not self._jung:
+            self._jung = jung
+            return Edit.EXTEND
+
+        # "고" + "ㅏ" -> "과" / "ㅗ" + "ㅏ" -> "ㅘ"
+        composite = COMPOSE_JUNGSEONG.get((self._jung, jung)) if self._jung else None
+        if composite and not self._jong:
+            self._jung = composite
+            # "ㅗ" never matches "ㅘ", unlike "[고-굏]" matching "과"
+            return Edit.EXTEND if self._cho else Edit.REVISE
+
+        # "갈" + "ㅏ" -> "가라" / "갉" + "ㅏ" -> "갈가"
+        # | the previous Syllable loses its Jongseong, which revises the query
+        # | e.g. "묵" never matches "뭅궈", but "[무-뭏][구-궇]" does
+        if self._jong:
+            first, second = decompose_jongseong(self._jong)
+            if second and first != second:
+                self._jong, moved = first, second
+            else:
+                self._jong, moved = None, self._jong
+            self.commit()
+            self._cho = to_choseong(to_compat_jamo(moved))
+            self._jung = jung
+            return Edit.REVISE
+
+        self.commit()
+        self._jung = jung
+        return Edit.EXTEND
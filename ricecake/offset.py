@@ -5,6 +5,65 @@
 - `*_offset()`: Calculate codepoint offsets
 """
 
+__all__ = [
+    "SYLLABLE_BASE",
+    "SYLLABLE_END",
+    "JAMO_BASE",
+    "JAMO_END",
+    "MODERN_CHOSEONG_BASE",
+    "MODERN_CHOSEONG_END",
+    "ARCHAIC_CHOSEONG_BASE",
+    "ARCHAIC_CHOSEONG_END",
+    "CHOSEONG_FILLER",
+    "JONGSEONG_FILLER",
+    "MODERN_JUNGSEONG_BASE",
+    "MODERN_JUNGSEONG_END",
+    "ARCHAIC_JUNGSEONG_BASE",
+    "ARCHAIC_JUNGSEONG_END",
+    "MODERN_JONGSEONG_BASE",
+    "MODERN_JONGSEONG_END",
+    "ARCHAIC_JONGSEONG_BASE",
+    "ARCHAIC_JONGSEONG_END",
+    "CHOSEONG_COUNT",
+    "JUNGSEONG_COUNT",
+    "JONGSEONG_COUNT",
+    "CHOSEONG_COEF",
+    "JUNGSEONG_COEF",
+    "JONGSEONG_COEF",
+    "COMPAT_JAMO_BASE",
+    "COMPAT_JAMO_END",
+    "MODERN_COMPAT_JAUM_BASE",
+    "MODERN_COMPAT_JAUM_END",
+    "MODERN_COMPAT_MOUM_BASE",
+    "MODERN_COMPAT_MOUM_END",
+    "COMPAT_HANGUL_FILLER",
+    "ARCHAIC_COMPAT_JAUM_BASE",
+    "ARCHAIC_COMPAT_JAUM_END",
+    "ARCHAIC_COMPAT_MOUM_BASE",
+    "ARCHAIC_COMPAT_MOUM_END",
+    "JAMO_EXTENDED_A_BASE",
+    "JAMO_EXTENDED_A_END",
+    "JAMO_EXTENDED_B_BASE",
+    "JAMO_EXTENDED_B_END",
+    "HALFWIDTH_JAMO_BASE",
+    "HALFWIDTH_JAMO_END",
+    "is_syllable",
+    "is_jamo",
+    "is_compat_jamo",
+    "is_compat_jaum",
+    "is_compat_moum",
+    "is_hangul",
+    "syllable_offset",
+    "jamo_offset",
+    "choseong_offset",
+    "jungseong_offset",
+    "jongseong_offset",
+    "compat_jamo_offset",
+    "compat_jaum_offset",
+    "compat_moum_offset",
+]
+
+
 # https://en.wikipedia.org/wiki/Hangul_Syllables
 SYLLABLE_BASE = 0xAC00  # '가'
 SYLLABLE_END = 0xD7A3  # '힣'
@@ -1,6 +1,10 @@
 """Generates regex patterns tailored for searching Korean texts."""
 
+import heapq
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
 
 from .compose import (
     compose,
@@ -10,12 +14,19 @@ from .compose import (
     set_jongseong,
 )
 from .convert import to_compat_jamo
+from .corpus import Column, Corpus
 from .offset import compat_jaum_offset, is_compat_jaum, is_syllable
 
-__all__ = ["Searcher"]
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor, Future
 
+    from _typeshed import SupportsRichComparison
 
-CHOSEONG_SEARCH_PATTERN = [
+__all__ = ["Hit", "Searcher", "rank", "rank_by_length", "sort_by_collation"]
+
+
+CHOSEONG_SEARCH_PATTERN = (
     "[ㄱ가-깋]",
     "[ㄲ까-낗]",
     "ㄳ",
@@ -46,7 +57,7 @@ CHOSEONG_SEARCH_PATTERN = [
     "[ㅌ타-팋]",
     "[ㅍ파-핗]",
     "[ㅎ하-힣]",
-]
+)
 
 
 def choseong_pattern(compat_jaum: str) -> str:
@@ -62,7 +73,7 @@ def incremental_pattern(c: str, /) -> str:
 
     # 2. Syllable
     if not is_syllable(c):
-        return c
+        return re.escape(c)
     cho, jung, jong = decompose(c)
 
     # 2.1. No Jongseong
@@ -106,11 +117,238 @@ def incremental_pattern(c: str, /) -> str:
     return f"(?:{jong_completion}|{jong_removed}{cho_search})"
 
 
+UTF8_BOUNDARIES = (0x7F, 0x7FF, 0xFFFF)
+
+
+def utf8_ranges(lo: int, hi: int) -> list[list[tuple[int, int]]]:
+    """Splits a codepoint range into sequences of UTF-8 byte ranges.
+
+    Each sequence matches the UTF-8 encoding of a contiguous part of the range,
+    one byte range per encoded byte. Surrogates are skipped.
+    e.g. `[가-깋]` (U+AC00-U+AC1B) -> `[[(0xEA, 0xEA), (0xB0, 0xB0), (0x80, 0x9B)]]`
+    """
+    if lo > hi:
+        return []
+
+    # surrogates cannot be encoded, and thus never appear in UTF-8 texts
+    if lo <= 0xDFFF and hi >= 0xD800:
+        return utf8_ranges(lo, 0xD7FF) + utf8_ranges(0xE000, hi)
+
+    # 1. split into ranges of the same encoded length
+    for boundary in UTF8_BOUNDARIES:
+        if lo <= boundary < hi:
+            return utf8_ranges(lo, boundary) + utf8_ranges(boundary + 1, hi)
+
+    # 2. split until only the last differing bytes cover their full range
+    # | e.g. U+AC1B-U+AC45 -> U+AC1B-U+AC3F + U+AC40-U+AC45
+    for i in range(1, len(chr(lo).encode())):
+        mask = (1 << (6 * i)) - 1
+        if lo & ~mask == hi & ~mask:
+            break
+        if lo & mask:
+            return utf8_ranges(lo, lo | mask) + utf8_ranges((lo | mask) + 1, hi)
+        if hi & mask != mask:
+            return utf8_ranges(lo, (hi & ~mask) - 1) + utf8_ranges(hi & ~mask, hi)
+
+    return [list(zip(chr(lo).encode(), chr(hi).encode(), strict=True))]
+
+
+def utf8_literal(c: str, /) -> bytes:
+    return b"".join(b"\\x%02x" % byte for byte in c.encode())
+
+
+def utf8_sequence(seq: list[tuple[int, int]]) -> bytes:
+    return b"".join(
+        b"\\x%02x" % lo if lo == hi else b"[\\x%02x-\\x%02x]" % (lo, hi)
+        for lo, hi in seq
+    )
+
+
+def utf8_class(ranges: list[tuple[int, int]]) -> bytes:
+    alternatives = [
+        utf8_sequence(seq) for lo, hi in ranges for seq in utf8_ranges(lo, hi)
+    ]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return b"(?:" + b"|".join(alternatives) + b")"
+
+
+# NOTE: only covers the syntax used by the patterns generated in this module
+# | - literal characters and escaped (`re.escape()`) characters
+# | - character classes made of characters and ranges, e.g. `[ㄱ가-깋]`
+# | - ASCII syntax such as `(?:`, `|`, `)`, and `.*?`, which is kept as is
+def utf8_pattern(pattern: str, /) -> bytes:
+    """Translates a regex pattern for `str` into a pattern for UTF-8 `bytes`.
+
+    Non-ASCII characters are replaced with their UTF-8 byte sequences,
+    and character classes are replaced with alternations of byte ranges.
+
+    Raises:
+        ValueError: If the pattern uses unsupported syntax e.g. negated classes.
+    """
+    out: list[bytes] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+
+        if c == "\\":
+            out.append(utf8_literal(pattern[i + 1]))
+            i += 2
+            continue
+
+        if c != "[":
+            out.append(c.encode() if c.isascii() else utf8_literal(c))
+            i += 1
+            continue
+
+        # character class
+        if pattern[i + 1] == "^":
+            raise ValueError("negated character classes are not supported")
+
+        ranges: list[tuple[int, int]] = []
+        i += 1
+        while pattern[i] != "]":
+            if pattern[i] == "\\":
+                i += 1
+            lo = hi = ord(pattern[i])
+            i += 1
+            if pattern[i] == "-" and pattern[i + 1] != "]":
+                i += 1
+                if pattern[i] == "\\":
+                    i += 1
+                hi = ord(pattern[i])
+                i += 1
+            ranges.append((lo, hi))
+        out.append(utf8_class(ranges))
+        i += 1
+
+    return b"".join(out)
+
+
+# number of records first scanned at once while keeping only the top hits
+# | doubled after each chunk, so that a scan that cannot stop early
+# | costs only a few more chunks than scanning the whole corpus at once
+TOP_CHUNK_SIZE = 1024
+
+
+def scan_matches(
+    column: Column,
+    pattern: re.Pattern[str],
+    start: int,
+    stop: int,
+) -> list[tuple[int, re.Match[str]]]:
+    return list(column.scan(pattern, start, stop))
+
+
+class Hit(NamedTuple):
+    """A record matching the query.
+
+    Attributes:
+        record: Index of the record in the corpus.
+        score: Sum of the weights of the matching fields.
+        field: The matching field with the highest weight.
+        start: Start position of the match in the text of `field`.
+        end: End position of the match in the text of `field`.
+        exact: Whether the match is the query itself, rather than a completion
+            such as `"각"` for `"가"` or an alternation such as `"일기"` for `"읽"`.
+        length: Total length of the texts of the record.
+    """
+
+    record: int
+    score: float
+    field: str
+    start: int
+    end: int
+    exact: bool
+    length: int
+
+
+def rank(hit: Hit, /) -> tuple[float, bool, int, int, int, int]:
+    """Default ranking of hits. Lower is better.
+
+    Compares the score, exact matches over completions, earlier matches,
+    shorter matches, shorter records, and finally the index of the records.
+    """
+    return (
+        -hit.score,
+        not hit.exact,
+        hit.start,
+        hit.end - hit.start,
+        hit.length,
+        hit.record,
+    )
+
+
+def rank_by_length(hit: Hit, /) -> tuple[int, float, bool, int, int, int]:
+    """Ranking of hits that prefers shorter records. Lower is better.
+
+    Compares the length of the records first, and then the same as `rank()`.
+    Suits autocompletion, and lets a search with a `limit` stop early
+    as soon as the rest of a corpus sorted by length is longer than its hits.
+    """
+    return (
+        hit.length,
+        -hit.score,
+        not hit.exact,
+        hit.start,
+        hit.end - hit.start,
+        hit.record,
+    )
+
+
+def sort_by_collation(hits: list[Hit], corpus: Corpus, /) -> None:
+    """Sorts hits in place by the collation keys stored in the corpus.
+
+    Records with the same key are ordered by their index.
+    Hits are sorted by the `int` ranks from `corpus.collation_ranks()`,
+    which is about twice as fast as comparing the `str` keys themselves.
+
+    Raises:
+        ValueError: If the corpus was created without a `collation_field`.
+    """
+    if corpus.collation_field is None:
+        raise ValueError("corpus does not store collation keys")
+
+    ranks = corpus.collation_ranks()
+    hits.sort(key=lambda hit: ranks[hit.record])
+
+
+# rankings where no hit can beat the best possible one: the highest score,
+# an exact match at the start, and the shortest match and record
+EARLY_STOP_KEYS = (rank, rank_by_length)
+
+
+def collect_hits(
+    query: str,
+    corpus: Corpus,
+    matches: Iterable[tuple[str, Iterable[tuple[int, re.Match[str]]]]],
+) -> list[Hit]:
+    scores: dict[int, float] = {}
+    best: dict[int, tuple[str, re.Match[str]]] = {}
+
+    # the first match of a record is kept, which is from the heaviest field
+    fields = sorted(matches, key=lambda field: -corpus.weights[field[0]])
+    for field, found in fields:
+        weight = corpus.weights[field]
+        for index, m in found:
+            scores[index] = scores.get(index, 0.0) + weight
+            best.setdefault(index, (field, m))
+
+    hits: list[Hit] = []
+    for index, score in scores.items():
+        field, m = best[index]
+        offset = corpus.columns[field].offsets[index]
+        start, end = m.start() - offset, m.end() - offset
+        exact = m.group() == query
+        hits.append(Hit(index, score, field, start, end, exact, corpus.length(index)))
+    return hits
+
+
 # DOC: did you know? writing human language is a lot harder than programming language
 # TEST: ASAP: speaking of docs, I haven't tested anything I coded so far.
 # | I should add example sections with doctests at some point
 # | when is that some point? who knows.
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class Searcher:
     """Fuzzy & incremental search for Korean texts.
 
@@ -125,7 +363,163 @@ class Searcher:
     jongseong_completion: bool
     incremental: bool
     fuzzy: bool
-    # FEAT: LATER: sort-by, regex flags, filter, search/match/fullmatch
+    # FEAT: LATER: regex flags, filter, search/match/fullmatch
+
+    def pattern(self, query: str, /) -> str:
+        """Generates a regex pattern that searches for the query."""
+        if not query:
+            return ""
+
+        patterns = [self._search_pattern(c) for c in query[:-1]]
+        if self.incremental:
+            patterns.append(incremental_pattern(query[-1]))
+        else:
+            patterns.append(self._search_pattern(query[-1]))
+
+        return (".*?" if self.fuzzy else "").join(patterns)
+
+    def bytes_pattern(self, query: str, /) -> bytes:
+        """Generates a regex pattern that searches for the query in UTF-8 bytes.
+
+        The pattern can be used to search `bytes`, `bytearray`, `memoryview`,
+        and `mmap` objects directly without decoding them to `str`.
+        Match positions are byte offsets of the UTF-8 buffer.
+        """
+        return utf8_pattern(self.pattern(query))
+
+    def compile(self, query: str, /) -> re.Pattern[str]:
+        """Compiles a regex pattern that searches for the query."""
+        return re.compile(self.pattern(query))
+
+    def compile_bytes(self, query: str, /) -> re.Pattern[bytes]:
+        """Compiles a regex pattern that searches for the query in UTF-8 bytes."""
+        return re.compile(self.bytes_pattern(query))
+
+    def search(
+        self,
+        query: str,
+        corpus: Corpus,
+        /,
+        *,
+        limit: int | None = None,
+        key: "Callable[[Hit], SupportsRichComparison]" = rank,
+        within: Iterable[int] | None = None,
+        executor: "Executor | None" = None,
+        chunk_size: int = 65536,
+    ) -> list[Hit]:
+        """Searches the records matching the query in any of their fields.
+
+        Each field is scanned as a whole column, and the weights of the matching
+        fields are summed up. Hits are sorted by `key`, which defaults to `rank()`.
+
+        With a `limit`, if `key` is `rank()` or `rank_by_length()` and
+        `corpus.sorted_by_length` is set, only the best hits are kept while
+        scanning the corpus, and scanning stops as soon as the remaining records
+        cannot beat the last hit. With `rank_by_length()`, that is once the rest
+        of the records are longer. With `rank()`, the last hit must match every
+        field exactly at the start, which rarely happens with multiple fields
+        or Choseong search and completions.
+
+        With a `ThreadPoolExecutor`, disjoint slices of `chunk_size` records are
+        scanned concurrently, sharing the same corpus without copying it.
+        This only pays off on free-threaded builds of CPython, since `re` does not
+        release the GIL. Use `benchthreads.py` to compare it for your deployment.
+
+        Args:
+            query: Text to search for.
+            corpus: Records to search from.
+            limit: Maximum number of hits to return.
+            key: Ranking of the hits, where lower is better.
+            within: Only search these records, e.g. the hits of a previous query.
+                Duplicate indices are ignored.
+            executor: Thread pool to scan the corpus with.
+            chunk_size: Number of records scanned by each task of the `executor`.
+        """
+        pattern = self.compile(query)
+
+        if (
+            limit is not None
+            and within is None
+            and executor is None
+            and key in EARLY_STOP_KEYS
+            and corpus.sorted_by_length
+        ):
+            return self._search_top(query, pattern, corpus, limit, key)
+
+        matches: list[tuple[str, list[tuple[int, re.Match[str]]]]]
+        if within is not None:
+            within = list(dict.fromkeys(within))  # each record is scored only once
+            matches = [
+                (field, [(i, m) for i in within if (m := column.search(pattern, i))])
+                for field, column in corpus.columns.items()
+            ]
+        elif executor is None:
+            matches = [
+                (field, scan_matches(column, pattern, 0, len(column)))
+                for field, column in corpus.columns.items()
+            ]
+        else:
+            size = len(corpus)
+            tasks: list[tuple[str, "Future[list[tuple[int, re.Match[str]]]]"]] = []
+            for field, column in corpus.columns.items():
+                _ = column.text  # join pending texts before sharing it across threads
+                for start in range(0, size, chunk_size):
+                    stop = min(start + chunk_size, size)
+                    task = executor.submit(scan_matches, column, pattern, start, stop)
+                    tasks.append((field, task))
+
+            # collected in the order of submission, same as scanning each column
+            matches = [(field, task.result()) for field, task in tasks]
+
+        hits = collect_hits(query, corpus, matches)
+        if limit is not None:
+            return heapq.nsmallest(limit, hits, key=key)
+        hits.sort(key=key)
+        return hits
+
+    def _search_top(
+        self,
+        query: str,
+        pattern: re.Pattern[str],
+        corpus: Corpus,
+        limit: int,
+        key: "Callable[[Hit], SupportsRichComparison]",
+    ) -> list[Hit]:
+        if limit <= 0:
+            return []
+
+        max_score = sum(max(weight, 0.0) for weight in corpus.weights.values())
+        top: list[Hit] = []
+        size = len(corpus)
+        start, chunk_size = 0, TOP_CHUNK_SIZE
+        while start < size:
+            # no remaining record can rank higher than this hit
+            # | records are sorted by length, so the rest are at least this long
+            # | every character of the query matches at least one character
+            # | the records in `top` have lower indices, and win ties with it
+            if len(top) == limit:
+                best = Hit(
+                    record=start,
+                    score=max_score,
+                    field="",
+                    start=0,
+                    end=len(query),
+                    exact=True,
+                    length=corpus.length(start),
+                )
+                if min(top[-1], best, key=key) is top[-1]:
+                    break
+
+            stop = min(start + chunk_size, size)
+            matches = [
+                (field, column.scan(pattern, start, stop))
+                for field, column in corpus.columns.items()
+            ]
+            hits = collect_hits(query, corpus, matches)
+            top = heapq.nsmallest(limit, [*top, *hits], key=key)
+            start, chunk_size = stop, chunk_size * 2
+
+        return top
 
     def _search_pattern(self, c: str, /) -> str:
         # "ㄱ" -> "[ㄱ가-깋]"
@@ -136,4 +530,4 @@ class Searcher:
         if self.jongseong_completion and is_syllable(c) and get_jongseong(c) is None:
             return f"[{c}-{set_jongseong(c, 'ᇂ')}]"
 
-        return c
+        return re.escape(c)
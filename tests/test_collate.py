@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from ricecake import Corpus, Searcher, collation_key, sort_by_collation
+
+SEARCHER = Searcher(
+    choseong_search=True,
+    jongseong_completion=True,
+    incremental=True,
+    fuzzy=True,
+)
+
+
+def test_collation_key_order() -> None:
+    texts = ["까", "ㄲ", "깋", "가", "ㄳ", "ㄱ", "ㅏ", "a"]
+    assert sorted(texts, key=collation_key) == [
+        "a",
+        "ㄱ",
+        "ㄳ",
+        "가",
+        "깋",
+        "ㄲ",
+        "까",
+        "ㅏ",
+    ]
+
+
+def test_sort_by_collation() -> None:
+    rng = random.Random(0)
+    alphabet = "ㄱㄲㄳ가각까깋나ㅏa"
+    corpus = Corpus({"name": 1.0, "alias": 1.0}, collation_field="name")
+    for _ in range(3):
+        corpus.extend(
+            {
+                "name": "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))),
+                "alias": rng.choice(alphabet),
+            }
+            for _ in range(200)
+        )
+        hits = SEARCHER.search("", corpus)
+        sort_by_collation(hits, corpus)
+        expected = sorted(
+            hits,
+            key=lambda hit: (collation_key(corpus[hit.record]["name"]), hit.record),
+        )
+        assert hits == expected
+
+
+def test_sort_by_collation_without_field() -> None:
+    corpus = Corpus({"name": 1.0})
+    corpus.append({"name": "가"})
+    assert corpus.collation_keys == []
+    with pytest.raises(ValueError):
+        sort_by_collation(SEARCHER.search("가", corpus), corpus)
+
+
+def test_unknown_collation_field() -> None:
+    with pytest.raises(ValueError):
+        Corpus({"name": 1.0}, collation_field="alias")
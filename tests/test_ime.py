@@ -0,0 +1,97 @@
+import itertools
+import random
+
+import pytest
+
+from ricecake import Composer, Edit, Searcher, broader_queries, keystrokes
+from ricecake import offset as o
+
+# every Compatibility Jamo key of the 2-set Korean keyboard layout
+KEYS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎㅏㅐㅑㅒㅓㅔㅕㅖㅗㅛㅜㅠㅡㅣ"
+
+INCREMENTAL_SEARCHERS = [
+    Searcher(
+        choseong_search=choseong_search,
+        jongseong_completion=jongseong_completion,
+        incremental=True,
+        fuzzy=fuzzy,
+    )
+    for choseong_search, jongseong_completion, fuzzy in (
+        itertools.product([False, True], repeat=3)
+    )
+]
+
+
+def typing_steps(rng: random.Random) -> list[tuple[str, str, Edit]]:
+    """Types random keystrokes, recording each text before and after a key."""
+    steps: list[tuple[str, str, Edit]] = []
+    for _ in range(500):
+        composer = Composer()
+        before = ""
+        for _ in range(rng.randint(1, 6)):
+            edit = composer.push(rng.choice(KEYS))
+            steps.append((before, composer.text, edit))
+            before = composer.text
+    return steps
+
+
+def mutate(text: str, rng: random.Random) -> str:
+    """Replaces the Jungseong or Jongseong of a random Syllable in the text."""
+    i = rng.randrange(len(text))
+    if not o.is_syllable(text[i]):
+        return text
+    code = o.syllable_offset(text[i])
+    if rng.random() < 0.5:
+        code += rng.randrange(o.JONGSEONG_COUNT) - code % o.JONGSEONG_COUNT
+    else:
+        jung = code // o.JUNGSEONG_COEF % o.JUNGSEONG_COUNT
+        code += (rng.randrange(o.JUNGSEONG_COUNT) - jung) * o.JUNGSEONG_COEF
+    return text[:i] + chr(o.SYLLABLE_BASE + code) + text[i + 1 :]
+
+
+def candidate_texts(
+    steps: list[tuple[str, str, Edit]], rng: random.Random
+) -> list[str]:
+    """Typed texts, and their variants with other Jungseongs or Jongseongs."""
+    texts = {after for _, after, _ in steps}
+    texts |= {mutate(text, rng) for text in texts for _ in range(4)}
+    texts |= {mutate(text, rng) for text in texts}
+    return sorted(texts)
+
+
+@pytest.mark.parametrize("searcher", INCREMENTAL_SEARCHERS)
+def test_extend_narrows_search(searcher: Searcher) -> None:
+    rng = random.Random(0)
+    steps = typing_steps(rng)
+    texts = candidate_texts(steps, rng)
+    for before, after, edit in steps:
+        if edit is not Edit.EXTEND or not before:
+            continue
+        old, new = searcher.compile(before), searcher.compile(after)
+        for text in texts:
+            if new.search(text):
+                assert old.search(text), (before, after, text)
+
+
+def test_moving_jongseong_is_revision() -> None:
+    composer = Composer()
+    for key in "ㄱㅏㄹ":
+        composer.push(key)
+    assert composer.text == "갈"
+    assert composer.push("ㅏ") is Edit.REVISE
+    assert composer.text == "가라"
+
+
+@pytest.mark.parametrize("text", ["닭", "읽기", "왜", "ㄳ", "a가"])
+def test_keystrokes_compose_text(text: str) -> None:
+    composer = Composer()
+    for c in text:
+        for key in keystrokes(c):
+            composer.push(key)
+    assert composer.text == text
+
+
+def test_broader_queries() -> None:
+    assert broader_queries("서울", incremental=True) == ["서우", "서ㅇ", "서"]
+    assert broader_queries("서울", incremental=False) == ["서"]
+    assert broader_queries("", incremental=True) == []
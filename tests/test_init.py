@@ -0,0 +1,45 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import ricecake
+
+
+@pytest.mark.parametrize("submodule", list(ricecake._LAZY_SUBMODULES))
+def test_lazy_names_match_submodule(submodule: str) -> None:
+    module = importlib.import_module(f"ricecake.{submodule}")
+    assert ricecake._LAZY_SUBMODULES[submodule] == module.__all__
+
+
+def test_all_names_resolve() -> None:
+    assert len(ricecake.__all__) == len(set(ricecake.__all__))
+    for name in ricecake.__all__:
+        assert getattr(ricecake, name) is not None
+
+
+def test_compose_is_function() -> None:
+    assert callable(ricecake.compose)
+    assert ricecake.compose("ᄀ", "ᅡ", None) == "가"
+
+
+@pytest.mark.parametrize("submodule", list(ricecake._LAZY_SUBMODULES))
+def test_submodule_attribute(submodule: str) -> None:
+    assert getattr(ricecake, submodule) is sys.modules[f"ricecake.{submodule}"]
+
+
+def test_dir_hides_type_checking() -> None:
+    assert "TYPE_CHECKING" not in dir(ricecake)
+
+
+def test_import_is_lazy() -> None:
+    code = "import sys, ricecake; print(sorted(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for submodule in ricecake._LAZY_SUBMODULES:
+        assert f"'ricecake.{submodule}'" not in result.stdout
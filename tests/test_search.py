@@ -0,0 +1,113 @@
+import itertools
+import random
+import re
+from collections.abc import Callable
+
+import pytest
+
+from ricecake import Corpus, Hit, Searcher, rank, rank_by_length
+from ricecake import search as search_module
+
+SEARCHERS = [
+    Searcher(
+        choseong_search=choseong_search,
+        jongseong_completion=jongseong_completion,
+        incremental=incremental,
+        fuzzy=fuzzy,
+    )
+    for choseong_search, jongseong_completion, incremental, fuzzy in (
+        itertools.product([False, True], repeat=4)
+    )
+]
+
+
+def random_corpus(rng: random.Random) -> Corpus:
+    alphabet = "가각갈나날다닭ㄱ ab"
+    records = [
+        {
+            field: "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+            for field in ("name", "alias", "address")
+        }
+        for _ in range(rng.randint(0, 40))
+    ]
+    records.sort(key=lambda record: sum(map(len, record.values())))
+    corpus = Corpus({"name": 2.0, "alias": 1.0, "address": rng.choice([0.5, -1.0])})
+    corpus.extend(records)
+    return corpus
+
+
+@pytest.mark.parametrize("key", [rank, rank_by_length])
+def test_limit_matches_full_search(
+    monkeypatch: pytest.MonkeyPatch,
+    key: Callable[[Hit], tuple[float, ...]],
+) -> None:
+    monkeypatch.setattr(search_module, "TOP_CHUNK_SIZE", 3)
+    rng = random.Random(0)
+    for _ in range(100):
+        corpus = random_corpus(rng)
+        assert corpus.sorted_by_length
+        query = "".join(rng.choice("가갈ㄱ다닭a") for _ in range(rng.randint(1, 3)))
+        for searcher in SEARCHERS:
+            hits = searcher.search(query, corpus, key=key)
+            for limit in (-1, 0, 1, 2, 5):
+                top = searcher.search(query, corpus, key=key, limit=limit)
+                assert top == hits[: max(limit, 0)]
+
+
+def test_within_ignores_duplicates() -> None:
+    corpus = Corpus({"name": 1.0})
+    corpus.extend({"name": text} for text in ["가", "나", "가나"])
+    searcher = SEARCHERS[0]
+    hits = searcher.search("가", corpus, within=[2, 0, 2, 0, 1])
+    assert hits == searcher.search("가", corpus)
+    assert [hit.score for hit in hits] == [1.0, 1.0]
+
+
+def random_codepoint(rng: random.Random) -> int:
+    # mostly around the UTF-8 length boundaries and Hangul
+    lo, hi = rng.choice([
+        (0, 0x7F),
+        (0x80, 0x7FF),
+        (0x800, 0xFFFF),
+        (0x10000, 0x10FFFF),
+        (0x3131, 0xD7A3),
+    ])
+    return rng.randint(lo, hi)
+
+
+def test_utf8_ranges() -> None:
+    rng = random.Random(0)
+    for _ in range(6000):
+        lo, hi = sorted((random_codepoint(rng), random_codepoint(rng)))
+        pattern = re.compile(search_module.utf8_class([(lo, hi)]))
+        samples = {lo - 1, lo, hi, hi + 1, *(random_codepoint(rng) for _ in range(8))}
+        for code in samples:
+            if not 0 <= code <= 0x10FFFF or 0xD800 <= code <= 0xDFFF:
+                continue
+            encoded = chr(code).encode()
+            assert bool(pattern.fullmatch(encoded)) == (lo <= code <= hi), (
+                lo,
+                hi,
+                code,
+            )
+
+
+@pytest.mark.parametrize("searcher", SEARCHERS)
+def test_bytes_pattern_matches_str_pattern(searcher: Searcher) -> None:
+    rng = random.Random(0)
+    alphabet = "가각갈갉깋나ㄱㄲㄳㅏ닭읽일기a.é😀 "
+    for _ in range(300):
+        query = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+        pattern = searcher.compile(query)
+        bytes_pattern = searcher.compile_bytes(query)
+        for _ in range(10):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            m = pattern.search(text)
+            bytes_m = bytes_pattern.search(text.encode())
+            if m is None:
+                assert bytes_m is None, (query, text)
+                continue
+            assert bytes_m is not None, (query, text)
+            start = len(text[: m.start()].encode())
+            end = len(text[: m.end()].encode())
+            assert bytes_m.span() == (start, end), (query, text)